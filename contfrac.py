@@ -7,11 +7,29 @@ Continued fractions are a representation of numbers expressed as recursive
 sums of integer parts and reciprocals of other numbers.
 """
 
+import collections
 import fractions
-import typing
+import functools
+import itertools
 
 __VERSION__ = '1.0.0'
 
+# Denominators longer than this many bits are expanded with the half-GCD,
+# which recurses down to numbers of __HALF_GCD_BASE_BITS bits.
+__HALF_GCD_MIN_BITS = 2048
+__HALF_GCD_BASE_BITS = 512
+
+# Continued fractions of floats with a maxlen up to this one and the
+# convergents up to this grade are cached.
+__MAX_CACHED_LENGTH = 64
+
+# Finite continued fractions up to this length are evaluated with a
+# function generated by make_evaluator().
+__MAX_UNROLLED_LENGTH = 64
+
+# Indexed by [with_spaces][force_floats] in arithmetical_expr().
+__JOINERS = (('+1/(', '+1.0/('), (' + 1/(', ' + 1.0/('))
+
 
 def continued_fraction(x, maxlen=30):
     """Computes the continued fraction of a number ``x`` expressed in many
@@ -56,14 +74,21 @@ def continued_fraction(x, maxlen=30):
             especially useful when computing continued fractions of irrational
             numbers.
 
+    Note:
+        The continued fractions of floats computed with a ``maxlen`` up to 64
+        are cached, so repeated calls do not compute them again. Larger
+        ``maxlen`` values and other types are generated lazily instead.
+
     Returns:
-        Generator[int, None, None]: continued fraction generated dynamically
+        Iterator[int]: continued fraction generated dynamically
     """
     if maxlen <= 0:
         raise ValueError('maxlen must be positive.')
     elif isinstance(x, int):
-        return __int_cont_frac(x, 1, max_amount=1)
+        return iter((int(x),))
     elif isinstance(x, float):
+        if maxlen <= __MAX_CACHED_LENGTH:
+            return iter(__cached_float_cont_frac(x, maxlen))
         return __float_cont_frac(x, maxlen)
     elif isinstance(x, fractions.Fraction):
         return __int_cont_frac(x.numerator, x.denominator, maxlen)
@@ -73,56 +98,230 @@ def continued_fraction(x, maxlen=30):
         raise TypeError('Unsupported input type {:}'.format(type(x)))
 
 
+# Only floats are worth caching: hashing a Fraction or a tuple key costs
+# about as much as the few divmod() calls expanding it.
+@functools.lru_cache(maxsize=256, typed=True)
+def __cached_float_cont_frac(x, maxlen):
+    return tuple(__float_cont_frac(x, maxlen))
+
+
 def __int_cont_frac(num, den, max_amount):
+    # Negating both terms keeps the same quotients; it makes all the
+    # remainders non-negative, as the half-GCD below requires.
+    if den < 0:
+        num, den = -num, -den
     amount = 0
+    # Long integer inputs are reduced in blocks of quotients with the
+    # subquadratic half-GCD, unless only few coefficients are requested,
+    # which is tested first as it rules out most calls the fastest.
+    # Other numeric types, like floats in tuples, take the plain loop.
+    while (4 * (max_amount - amount) > __HALF_GCD_MIN_BITS
+           and type(num) is int and type(den) is int
+           and 4 * (max_amount - amount) > den.bit_length()
+           > __HALF_GCD_MIN_BITS):
+        quotients = []
+        if num > den:
+            quotients, num, den = __half_gcd(num, den)
+        if not quotients:
+            integer_part, remainder = divmod(num, den)
+            quotients.append(integer_part)
+            num, den = den, remainder
+        yield from quotients[:max_amount - amount]
+        amount += len(quotients)
     while den != 0 and amount < max_amount:
-        integer_part = num // den
-        num -= integer_part * den
-        num, den = den, num
+        integer_part, remainder = divmod(num, den)
+        num, den = den, remainder
         amount += 1
         yield integer_part
 
 
+def __half_gcd(a, b):
+    """Computes a prefix of the quotients of the Euclidean algorithm on
+    ``a > b > 0``, stopping once the remainder is about half as long as ``a``.
+
+    Based on the recursive half-GCD: the quotients of the high halves of
+    ``a`` and ``b`` are mostly the quotients of ``a`` and ``b`` themselves,
+    so they are computed on the shorter numbers and then applied to ``a``
+    and ``b`` at once with their 2x2 matrix. Any wrong trailing quotient is
+    detected and dropped by ``__half_gcd_apply()``, so the result is always
+    exact.
+
+    Returns:
+        Tuple[List[int], int, int]: the quotients and the remainders
+            ``(a', b')`` the Euclidean algorithm reaches after them.
+    """
+    quotients, _, a, b = __half_gcd_matrix(a, b)
+    return quotients, a, b
+
+
+def __half_gcd_matrix(a, b):
+    # The matrix (m00, m01, m10, m11) maps the final remainders back to the
+    # inputs: a = m00 * a' + m01 * b' and b = m10 * a' + m11 * b'.
+    length = a.bit_length()
+    min_bits = length // 2 + 1
+    if length <= __HALF_GCD_BASE_BITS:
+        return __half_gcd_euclid(a, b, min_bits)
+    shift = length // 2
+    quotients, matrix, _, _ = __half_gcd_matrix(a >> shift, b >> shift)
+    quotients, matrix, a, b = __half_gcd_apply(a, b, quotients, matrix)
+    if b.bit_length() <= min_bits:
+        return quotients, matrix, a, b
+    integer_part, remainder = divmod(a, b)
+    a, b = b, remainder
+    quotients.append(integer_part)
+    matrix = (matrix[0] * integer_part + matrix[1], matrix[0],
+              matrix[2] * integer_part + matrix[3], matrix[2])
+    shift = 2 * min_bits - a.bit_length()
+    if b.bit_length() > min_bits and shift > 0 and b >> shift:
+        more, other, _, _ = __half_gcd_matrix(a >> shift, b >> shift)
+        more, other, a, b = __half_gcd_apply(a, b, more, other)
+        quotients.extend(more)
+        matrix = __matrix_product(matrix, other)
+    more, other, a, b = __half_gcd_euclid(a, b, min_bits)
+    quotients.extend(more)
+    return quotients, __matrix_product(matrix, other), a, b
+
+
+def __half_gcd_euclid(a, b, min_bits):
+    quotients = []
+    numerator_2_ago, numerator_1_ago = 0, 1
+    denominator_2_ago, denominator_1_ago = 1, 0
+    while b.bit_length() > min_bits:
+        integer_part, remainder = divmod(a, b)
+        a, b = b, remainder
+        numerator_2_ago, numerator_1_ago = (
+            numerator_1_ago, integer_part * numerator_1_ago + numerator_2_ago)
+        denominator_2_ago, denominator_1_ago = (
+            denominator_1_ago,
+            integer_part * denominator_1_ago + denominator_2_ago)
+        quotients.append(integer_part)
+    matrix = (numerator_1_ago, numerator_2_ago,
+              denominator_1_ago, denominator_2_ago)
+    return quotients, matrix, a, b
+
+
+def __half_gcd_apply(a, b, quotients, matrix):
+    # Inverts the matrix, whose determinant is (-1)**len(quotients).
+    m00, m01, m10, m11 = matrix
+    if len(quotients) % 2:
+        a, b = m01 * b - m11 * a, m10 * a - m00 * b
+    else:
+        a, b = m11 * a - m01 * b, m00 * b - m10 * a
+    # The quotients are exactly the ones of the Euclidean algorithm if and
+    # only if they lead to remainders a' > b' > 0. Otherwise the last
+    # quotients are wrong: undo them one by one.
+    while not a > b > 0 and quotients:
+        integer_part = quotients.pop()
+        a, b = integer_part * a + b, a
+        m00, m01 = m01, m00 - integer_part * m01
+        m10, m11 = m11, m10 - integer_part * m11
+    return quotients, (m00, m01, m10, m11), a, b
+
+
+def __matrix_product(m, n):
+    return (m[0] * n[0] + m[1] * n[2], m[0] * n[1] + m[1] * n[3],
+            m[2] * n[0] + m[3] * n[2], m[2] * n[1] + m[3] * n[3])
+
+
 def __float_cont_frac(real_number, max_amount):
-    fractional_part = 42
     amount = 0
     abs_tol = 10**-10
-    while not abs(fractional_part) <= abs_tol and amount < max_amount:
+    while amount < max_amount:
         integer_part = int(round(real_number, 10))
-        fractional_part = real_number - integer_part
-        real_number = 1.0 / fractional_part
         amount += 1
         yield integer_part
+        fractional_part = real_number - integer_part
+        if -abs_tol <= fractional_part <= abs_tol:
+            break
+        real_number = 1.0 / fractional_part
 
 
-def evaluate(cont_frac):
-    """Computes the floating point value of a finite continued fraction
-    representation.
+def evaluate(cont_frac, exact=False):
+    """Computes the value of a finite continued fraction representation,
+    as a float or, when ``exact`` is True, as a Fraction.
 
     That is the value of ``c[0] + 1/(c[1] + 1/(c[2] + 1/(c[3] + ...)))``
     for an input ``c``.
 
     Example:
         For an input of ``[2,3,4]`` is ``2 + 1/(3 + 1/4) = 30/13`` expressed as
-        2.3076923076923075.
+        2.3076923076923075, or as ``Fraction(30, 13)`` when ``exact`` is True.
 
     Args:
         cont_frac (Iterable[Union[int, float]]): representation of a continued
             fraction as iterable of numbers.
+        exact (bool): computes the value as a Fraction instead of a float
+            when True, avoiding rounding errors. Requires all coefficients to
+            be integers or Fractions, otherwise the value falls back to
+            a float.
 
     Returns:
-        float: the value of the continued fraction.
+        Union[float, fractions.Fraction]: the value of the continued fraction.
     """
-    if isinstance(cont_frac, typing.Generator):
-        cont_frac = list(cont_frac)
-    if len(cont_frac) == 0:
+    try:
+        amount = len(cont_frac)
+    except TypeError:
+        cont_frac = tuple(cont_frac)
+        amount = len(cont_frac)
+    if exact:
+        fraction = fractions.Fraction(0)
+        if amount == 0:
+            return fraction
+    elif amount == 0:
         return 0
-    fraction = 0
-    for i, coefficient in enumerate(reversed(cont_frac[1:])):
-        fraction = 1 / (coefficient + fraction)
+    elif amount <= __MAX_UNROLLED_LENGTH:
+        return make_evaluator(amount)(cont_frac)
+    else:
+        fraction = 0
+    return __evaluate_from(cont_frac, fraction)
+
+
+def __evaluate_from(cont_frac, fraction):
+    for i in range(len(cont_frac) - 1, 0, -1):
+        fraction = 1 / (cont_frac[i] + fraction)
     return cont_frac[0] + fraction
 
 
+@functools.lru_cache(maxsize=128)
+def make_evaluator(length):
+    """Generates a function computing the floating point value of finite
+    continued fractions of a fixed length.
+
+    The generated function is equivalent to ``evaluate()`` for inputs of the
+    given length, but it is compiled from the unrolled expression
+    ``c[0] + 1/(c[1] + 1/(c[2] + ...))``, so it runs no loop. Useful when
+    evaluating many continued fractions of the same length, such as
+    convergents of the same grade.
+
+    Lengths above 64 are not unrolled, keeping a deliberate margin below
+    the nesting limit of the Python parser: for them the generated function
+    runs the same loop as ``evaluate()`` instead.
+
+    Example:
+        ``make_evaluator(3)([2,3,4])`` is ``2 + 1/(3 + 1/4) = 30/13``
+        expressed as 2.3076923076923075.
+
+    Args:
+        length (int): amount of coefficients of the continued fractions
+            the generated function accepts.
+
+    Returns:
+        Callable[[Sequence[Union[int, float]]], float]: function computing
+            the value of a continued fraction given as indexable sequence of
+            numbers.
+    """
+    if length < 0:
+        raise ValueError('length must be non-negative.')
+    elif length == 0:
+        return lambda cont_frac: 0
+    elif length > __MAX_UNROLLED_LENGTH:
+        return lambda cont_frac: __evaluate_from(cont_frac, 0)
+    expression = '0'
+    for i in range(length - 1, 0, -1):
+        expression = '1 / (c[{:d}] + {:s})'.format(i, expression)
+    return eval('lambda c: c[0] + {:s}'.format(expression))
+
+
 def arithmetical_expr(cont_frac, with_spaces=True, force_floats=False):
     """Generates the arithmetical expression as string of a continued fraction.
 
@@ -146,19 +345,11 @@ def arithmetical_expr(cont_frac, with_spaces=True, force_floats=False):
         str: the arithmetical expression to evaluate the continued fraction's
              value.
     """
-    parts = []
-    i = 0
-    for i, coefficient in enumerate(cont_frac):
-        parts.append(str(coefficient))
-    if with_spaces:
-        joiner = ' + '
-    else:
-        joiner = '+'
-    if force_floats:
-        joiner += '1.0/('
-    else:
-        joiner += '1/('
-    return joiner.join(parts) + ')' * i
+    parts = [str(coefficient) for coefficient in cont_frac]
+    if not parts:
+        return ''
+    joiner = __JOINERS[bool(with_spaces)][bool(force_floats)]
+    return joiner.join(parts) + ')' * (len(parts) - 1)
 
 
 def convergents(x, max_grade=10):
@@ -181,18 +372,21 @@ def convergents(x, max_grade=10):
         Generator[Tuple[int, int], None, None]: sequence of (numerator,
             denominator) rational numbers approximating ``x``.
     """
-    numerator_2_ago = 0
-    numerator_1_ago = 1
-    denominator_2_ago = 1
-    denominator_1_ago = 0
-    for coefficient in continued_fraction(x, maxlen=max_grade + 1):
-        numerator = coefficient * numerator_1_ago + numerator_2_ago
-        numerator_2_ago = numerator_1_ago
-        numerator_1_ago = numerator
-        denominator = coefficient * denominator_1_ago + denominator_2_ago
-        denominator_2_ago = denominator_1_ago
-        denominator_1_ago = denominator
-        yield numerator, denominator
+    if max_grade < 0:
+        raise ValueError('max_grade must be non-negative.')
+    return __convergents_of(continued_fraction(x, maxlen=max_grade + 1))
+
+
+def __convergents_of(coefficients):
+    numerator_2_ago, numerator_1_ago = 0, 1
+    denominator_2_ago, denominator_1_ago = 1, 0
+    for coefficient in coefficients:
+        numerator_2_ago, numerator_1_ago = (
+            numerator_1_ago, coefficient * numerator_1_ago + numerator_2_ago)
+        denominator_2_ago, denominator_1_ago = (
+            denominator_1_ago,
+            coefficient * denominator_1_ago + denominator_2_ago)
+        yield numerator_1_ago, denominator_1_ago
 
 
 def convergent(x, grade):
@@ -208,11 +402,41 @@ def convergent(x, grade):
         grade (int): the grade of the produced convergent. A higher grade
             convergent approximates better the ``x`` value.
 
+    Note:
+        The convergents up to grade 64 are cached for each ``x`` other than
+        a list, so asking for another grade of the same ``x`` only computes
+        the convergents not obtained yet. Higher grades are computed from
+        scratch instead.
+
     Returns:
         Tuple[int, int]: pair (numerator, denominator) as rational number
             approximating ``x``.
     """
-    element = None
-    for element in convergents(x, max_grade=grade):
-        pass
-    return element
+    if isinstance(x, list) or not 0 <= grade <= __MAX_CACHED_LENGTH:
+        return __last_convergent(x, grade)
+    elif isinstance(x, fractions.Fraction):
+        # Hashing the integer terms is faster than hashing the Fraction.
+        known, pending = __cached_convergents(
+            (x.numerator, x.denominator), (int, int))
+    elif isinstance(x, tuple):
+        # The types of the elements are part of the cache key, as (1, 2)
+        # and (1.0, 2) are equal but have convergents of different types.
+        known, pending = __cached_convergents(x, tuple(map(type, x)))
+    else:
+        known, pending = __cached_convergents(x, None)
+    if len(known) <= grade:
+        known.extend(itertools.islice(pending, grade + 1 - len(known)))
+        if len(known) <= grade:
+            return known[-1] if known else None
+    return known[grade]
+
+
+# The convergents of x obtained so far and the generator of the next ones.
+@functools.lru_cache(maxsize=256, typed=True)
+def __cached_convergents(x, element_types):
+    return [], convergents(x, max_grade=__MAX_CACHED_LENGTH)
+
+
+def __last_convergent(x, grade):
+    last = collections.deque(convergents(x, max_grade=grade), maxlen=1)
+    return last[0] if last else None
@@ -10,34 +10,149 @@ import unittest
 
 import contfrac
 
+EVALUATE_TEST_VALUES = (
+    ((), 0),
+    ((0,), 0),
+    ((1,), 1),
+    ((20,), 20),
+    ((0, 20), 1 / 20),
+    ((-20,), -20),
+    ((1, 2), 1 + 1 / 2),
+    ((-1, 2), -1 + 1 / 2),
+    ((0, 1), 0 + 1 / 1),
+    ((0, 0, 0, 1), 0 + 1 / (0 + (1 / (0 + (1 / 1))))),
+    ((0, 0, 0, 17), 0 + 1 / (0 + (1 / (0 + (1 / 17))))),
+    ((1, 2, 3), 1 + 1 / (2 + 1 / 3)),
+    ((1, 2, 3, 4), 1 + 1 / (2 + (1 / (3 + (1 / 4))))),
+    ((1, 2, -3, 4), 1 + 1 / (2 + (1 / (-3 + (1 / 4))))),
+    ((1.1, 2, -3.34, 4), 1.1 + 1 / (2 + (1 / (-3.34 + (1 / 4))))),
+    ((3, 4, 12, 4), 649 / 200),
+    ((4, 2, 6, 7), 415 / 93),
+    (range(1, 5), 1 + 1 / (2 + (1 / (3 + (1 / 4))))),
+    (b'CD', 67 + 1 / 68),
+)
+
+EXPRESSION_DEFAULTS = (
+    ((), ''),
+    ((0,), '0'),
+    ((1,), '1'),
+    ((20,), '20'),
+    ((0, 20), '0 + 1/(20)'),
+    ((-20,), '-20'),
+    ((1, 2), '1 + 1/(2)'),
+    ((-1, 2), '-1 + 1/(2)'),
+    ((1, -2), '1 + 1/(-2)'),
+    ((0, 1), '0 + 1/(1)'),
+    ((0, 0, 0, 1), '0 + 1/(0 + 1/(0 + 1/(1)))'),
+    ((0, 0, 0, 17), '0 + 1/(0 + 1/(0 + 1/(17)))'),
+    ((1, 2, 3), '1 + 1/(2 + 1/(3))'),
+    ((1, 2, 3, 4), '1 + 1/(2 + 1/(3 + 1/(4)))'),
+    ((1, 2, -3, 4), '1 + 1/(2 + 1/(-3 + 1/(4)))'),
+    ((1.1, 2, -3.34, 4), '1.1 + 1/(2 + 1/(-3.34 + 1/(4)))'),
+    (range(1, 5), '1 + 1/(2 + 1/(3 + 1/(4)))'),
+)
+
+# Expected expression for each (with_spaces, force_floats) option pair.
+EXPRESSION_TEST_VALUES = tuple(
+    (input_value, (
+        ((True, False), default),
+        ((False, False), default.replace(' ', '')),
+        ((True, True), default.replace('1/', '1.0/')),
+        ((False, True), default.replace(' ', '').replace('1/', '1.0/')),
+    ))
+    for input_value, default in EXPRESSION_DEFAULTS
+)
+
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+GOLDEN_RATIO_AS_RATIO = GOLDEN_RATIO.as_integer_ratio()
+GOLDEN_RATIO_CONT_FRAC = (1,) * 50
+
+
+def exact_value(cont_frac):
+    """Value of a continued fraction of integers as Fraction, computed with
+    the convergents recurrence independently of contfrac."""
+    numerator_2_ago, numerator_1_ago = 0, 1
+    denominator_2_ago, denominator_1_ago = 1, 0
+    for coefficient in cont_frac:
+        numerator_2_ago, numerator_1_ago = (
+            numerator_1_ago, coefficient * numerator_1_ago + numerator_2_ago)
+        denominator_2_ago, denominator_1_ago = (
+            denominator_1_ago,
+            coefficient * denominator_1_ago + denominator_2_ago)
+    return fractions.Fraction(numerator_1_ago, denominator_1_ago)
+
 
 class TestEvaluateContfrac(unittest.TestCase):
     def test_evaluate_continued_fraction(self):
-        test_values = {
-            (): 0,
-            (0,): 0,
-            (1,): 1,
-            (20,): 20,
-            (0, 20): 1 / 20,
-            (-20,): -20,
-            (1, 2): 1 + 1 / 2,
-            (-1, 2): -1 + 1 / 2,
-            (0, 1): 0 + 1 / 1,
-            (0, 0, 0, 1): 0 + 1 / (0 + (1 / (0 + (1 / 1)))),
-            (0, 0, 0, 17): 0 + 1 / (0 + (1 / (0 + (1 / 17)))),
-            (1, 2, 3): 1 + 1 / (2 + 1 / 3),
-            (1, 2, 3, 4): 1 + 1 / (2 + (1 / (3 + (1 / 4)))),
-            (1, 2, -3, 4): 1 + 1 / (2 + (1 / (-3 + (1 / 4)))),
-            (1.1, 2, -3.34, 4): 1.1 + 1 / (2 + (1 / (-3.34 + (1 / 4)))),
-            (3, 4, 12, 4): 649 / 200,
-            (4, 2, 6, 7): 415 / 93,
-            range(1, 5): 1 + 1 / (2 + (1 / (3 + (1 / 4)))),
-            b'CD': 67 + 1 / 68,
-        }
-        for input_value, expected_output in test_values.items():
+        for input_value, expected_output in EVALUATE_TEST_VALUES:
             with self.subTest(contfrac_of=input_value):
                 result = contfrac.evaluate(input_value)
-                self.assertAlmostEqual(expected_output, result, places=6)
+                self.assertTrue(
+                    math.isclose(expected_output, result, abs_tol=5e-7),
+                    '{!r} != {!r}'.format(expected_output, result))
+
+    def test_evaluate_continued_fraction_iterators(self):
+        expected = 415 / 93
+        values = [
+            contfrac.continued_fraction((415, 93)),
+            iter([4, 2, 6, 7]),
+            map(int, '4267'),
+        ]
+        for value in values:
+            with self.subTest(input_value=value):
+                result = contfrac.evaluate(value)
+                self.assertTrue(
+                    math.isclose(expected, result, abs_tol=5e-7),
+                    '{!r} != {!r}'.format(expected, result))
+
+    def test_evaluate_long_continued_fraction(self):
+        for length in [63, 64, 65, 200]:
+            with self.subTest(length=length):
+                result = contfrac.evaluate([1] * length)
+                self.assertTrue(
+                    math.isclose(GOLDEN_RATIO, result, abs_tol=5e-13),
+                    '{!r} != {!r}'.format(GOLDEN_RATIO, result))
+
+    def test_make_evaluator(self):
+        for input_value, expected_output in EVALUATE_TEST_VALUES:
+            with self.subTest(contfrac_of=input_value):
+                evaluator = contfrac.make_evaluator(len(input_value))
+                result = evaluator(input_value)
+                self.assertTrue(
+                    math.isclose(expected_output, result, abs_tol=5e-7),
+                    '{!r} != {!r}'.format(expected_output, result))
+        for length in [64, 65, 300, 1000]:
+            with self.subTest(length=length):
+                result = contfrac.make_evaluator(length)([1] * length)
+                self.assertTrue(
+                    math.isclose(GOLDEN_RATIO, result, abs_tol=5e-13),
+                    '{!r} != {!r}'.format(GOLDEN_RATIO, result))
+                self.assertRaises(ZeroDivisionError,
+                                  contfrac.make_evaluator(length),
+                                  [1] * (length - 1) + [0])
+        self.assertRaises(ZeroDivisionError, contfrac.make_evaluator(3),
+                          [1, 2, 0])
+        self.assertRaises(ValueError, contfrac.make_evaluator, -1)
+
+    def test_evaluate_exact(self):
+        test_values = [
+            ((), fractions.Fraction(0)),
+            ((20,), fractions.Fraction(20)),
+            ((0, 20), fractions.Fraction(1, 20)),
+            ((2, 3, 4), fractions.Fraction(30, 13)),
+            ((4, 2, 6, 7), fractions.Fraction(415, 93)),
+            (tuple(contfrac.continued_fraction((3 ** 100, 2 ** 150),
+                                               maxlen=1000)),
+             fractions.Fraction(3 ** 100, 2 ** 150)),
+        ]
+        for input_value, expected_output in test_values:
+            with self.subTest(contfrac_of=input_value):
+                result = contfrac.evaluate(input_value, exact=True)
+                self.assertIsInstance(result, fractions.Fraction)
+                self.assertEqual(expected_output, result)
+        result = contfrac.evaluate([1.5, 2], exact=True)
+        self.assertIsInstance(result, float)
+        self.assertEqual(2.0, result)
 
     def test_evaluate_continued_fraction_with_zero_end(self):
         values = [
@@ -47,9 +162,8 @@ class TestEvaluateContfrac(unittest.TestCase):
             [1, 2, 3, 0, 0, 0, 0],
         ]
         for value in values:
-            with self.subTest(input_value=value):
-                with self.assertRaises(ZeroDivisionError):
-                    contfrac.evaluate(value)
+            with self.assertRaises(ZeroDivisionError, msg=repr(value)):
+                contfrac.evaluate(value)
 
     def test_evaluate_continued_fraction_unsupported_type_raises(self):
         self.assertRaises(TypeError, contfrac.evaluate, None)
@@ -60,93 +174,144 @@ class TestEvaluateContfrac(unittest.TestCase):
 
 class TestArithmeticExpression(unittest.TestCase):
     def test_expression_continued_fraction(self):
-        test_values = {
-            (): '',
-            (0,): '0',
-            (1,): '1',
-            (20,): '20',
-            (0, 20): '0 + 1/(20)',
-            (-20,): '-20',
-            (1, 2): '1 + 1/(2)',
-            (-1, 2): '-1 + 1/(2)',
-            (1, -2): '1 + 1/(-2)',
-            (0, 1): '0 + 1/(1)',
-            (0, 0, 0, 1): '0 + 1/(0 + 1/(0 + 1/(1)))',
-            (0, 0, 0, 17): '0 + 1/(0 + 1/(0 + 1/(17)))',
-            (1, 2, 3): '1 + 1/(2 + 1/(3))',
-            (1, 2, 3, 4): '1 + 1/(2 + 1/(3 + 1/(4)))',
-            (1, 2, -3, 4): '1 + 1/(2 + 1/(-3 + 1/(4)))',
-            (1.1, 2, -3.34, 4): '1.1 + 1/(2 + 1/(-3.34 + 1/(4)))',
-            range(1, 5): '1 + 1/(2 + 1/(3 + 1/(4)))',
-        }
-        for input_value, expected_default in test_values.items():
-            with self.subTest(contfrac_of=input_value):
-                result = contfrac.arithmetical_expr(input_value)
-                expected_output = expected_default
-                self.assertEqual(expected_output, result)
-            with self.subTest(contfrac_of=input_value, spaces=False):
-                result = contfrac.arithmetical_expr(input_value,
-                                                    with_spaces=False)
-                expected_output = expected_default.replace(' ', '')
-                self.assertEqual(expected_output, result)
-            with self.subTest(contfrac_of=input_value, floats=True):
-                result = contfrac.arithmetical_expr(input_value,
-                                                    force_floats=True)
-                expected_output = expected_default.replace('1/', '1.0/')
-                self.assertEqual(expected_output, result)
-            with self.subTest(contfrac_of=input_value,
-                              spaces=False, floats=True):
-                result = contfrac.arithmetical_expr(input_value,
-                                                    with_spaces=False,
-                                                    force_floats=True)
-                expected_output = expected_default.replace(' ', '')
-                expected_output = expected_output.replace('1/', '1.0/')
-                self.assertEqual(expected_output, result)
+        for input_value, variants in EXPRESSION_TEST_VALUES:
+            for (with_spaces, force_floats), expected_output in variants:
+                with self.subTest(contfrac_of=input_value,
+                                  spaces=with_spaces, floats=force_floats):
+                    result = contfrac.arithmetical_expr(
+                        input_value, with_spaces=with_spaces,
+                        force_floats=force_floats)
+                    self.assertEqual(expected_output, result)
 
 
 class TestContfracComputation(unittest.TestCase):
-    def test_continued_fraction_is_generators(self):
+    def test_continued_fraction_is_iterator(self):
         result = contfrac.continued_fraction(1)
-        self.assertIsInstance(result, typing.Generator)
+        self.assertIsInstance(result, typing.Iterator)
+        result = contfrac.continued_fraction((415, 93))
+        self.assertIsInstance(result, typing.Iterator)
+        result = contfrac.continued_fraction(415 / 93)
+        self.assertIsInstance(result, typing.Iterator)
 
     def test_continued_fraction_legal_values(self):
-        test_values = {
-            # Integers
-            0: [0],
-            1: [1],
-            123: [123],
-            -1: [-1],
-            -123: [-123],
-
-            # Tuples: (nominator, denominator)
-            (649, 200): [3, 4, 12, 4],
-            (415, 93): [4, 2, 6, 7],
-            (-649, 200): [-4, 1, 3, 12, 4],
-            (415, -93): [-5, 1, 1, 6, 7],
-
-            # Fractions
-            fractions.Fraction(649, 200): [3, 4, 12, 4],
-            fractions.Fraction(415, 93): [4, 2, 6, 7],
-            fractions.Fraction(-649, 200): [-4, 1, 3, 12, 4],
-            fractions.Fraction(415, -93): [-5, 1, 1, 6, 7],
-
-            # Floats
-            649 / 200: [3, 4, 12, 4],
-            -649 / 200: [-3, -4, -12, -4],
-            415 / 93: [4, 2, 6, 7],
-            0.84375: [0, 1, 5, 2, 2],
-        }
-        for input_value, expected_output in test_values.items():
+        integers = [
+            (0, [0]),
+            (1, [1]),
+            (123, [123]),
+            (-1, [-1]),
+            (-123, [-123]),
+        ]
+        # (nominator, denominator)
+        tuples = [
+            ((649, 200), [3, 4, 12, 4]),
+            ((415, 93), [4, 2, 6, 7]),
+            ((-649, 200), [-4, 1, 3, 12, 4]),
+            ((415, -93), [-5, 1, 1, 6, 7]),
+        ]
+        fracs = [
+            (fractions.Fraction(649, 200), [3, 4, 12, 4]),
+            (fractions.Fraction(415, 93), [4, 2, 6, 7]),
+            (fractions.Fraction(-649, 200), [-4, 1, 3, 12, 4]),
+            (fractions.Fraction(415, -93), [-5, 1, 1, 6, 7]),
+        ]
+        floats = [
+            (649 / 200, [3, 4, 12, 4]),
+            (-649 / 200, [-3, -4, -12, -4]),
+            (415 / 93, [4, 2, 6, 7]),
+            (0.84375, [0, 1, 5, 2, 2]),
+            (0.5, [0, 2]),
+            (2.0, [2]),
+            (-0.25, [0, -4]),
+        ]
+        # (input, continued fraction, its value, tolerance on the value)
+        test_values = (
+            [(x, cf, x, 0) for x, cf in integers]
+            + [(x, cf, fractions.Fraction(*x), 0) for x, cf in tuples]
+            + [(x, cf, x, 0) for x, cf in fracs]
+            + [(x, cf, x, 1e-8) for x, cf in floats]
+        )
+        for input_value, expected_output, value, delta in test_values:
             with self.subTest(contfrac_of=input_value):
                 result = list(contfrac.continued_fraction(input_value))
                 self.assertListEqual(expected_output, result)
                 with self.subTest(evaluating_contfrac_of=input_value):
-                    if isinstance(input_value, tuple):
-                        input_value = input_value[0] / input_value[1]
-                    elif isinstance(input_value, fractions.Fraction):
-                        input_value = float(input_value)
-                    evaluated = contfrac.evaluate(result)
-                    self.assertAlmostEqual(input_value, evaluated, delta=1e-8)
+                    evaluated = exact_value(result)
+                    self.assertAlmostEqual(value, evaluated, delta=delta)
+
+    def test_continued_fraction_long_integers(self):
+        fibonacci = [1, 1]
+        for _ in range(10000):
+            fibonacci.append(fibonacci[-1] + fibonacci[-2])
+        x = (fibonacci[-1], fibonacci[-2])
+        expected = [1] * (len(fibonacci) - 3) + [2]
+        result = list(contfrac.continued_fraction(x, maxlen=100000))
+        self.assertListEqual(expected, result)
+        result = list(contfrac.continued_fraction(x, maxlen=3000))
+        self.assertListEqual(expected[:3000], result)
+        values = [
+            (3 ** 5000, 2 ** 7000 + 1),
+            (-7 ** 3000, 5 ** 2500),
+            fractions.Fraction(11 ** 4000, -13 ** 3500),
+        ]
+        for x in values:
+            with self.subTest(contfrac_of=x):
+                result = list(contfrac.continued_fraction(x, maxlen=100000))
+                self.assertEqual(fractions.Fraction(x[0], x[1])
+                                 if isinstance(x, tuple) else x,
+                                 exact_value(result))
+                self.assertTrue(all(c > 0 for c in result[1:]))
+
+    def test_continued_fraction_repeated_calls(self):
+        for x in [(415, 93), [415, 93], fractions.Fraction(415, 93),
+                  415 / 93]:
+            with self.subTest(contfrac_of=x):
+                self.assertListEqual(
+                    [4, 2, 6, 7], list(contfrac.continued_fraction(x)))
+                self.assertListEqual(
+                    [4, 2, 6, 7], list(contfrac.continued_fraction(x)))
+                self.assertListEqual(
+                    [4, 2], list(contfrac.continued_fraction(x, maxlen=2)))
+        result = list(contfrac.continued_fraction((415, 93)))
+        self.assertIsInstance(result[0], int)
+        result = list(contfrac.continued_fraction((415.0, 93)))
+        self.assertIsInstance(result[0], float)
+
+    def test_continued_fraction_long_maxlen_is_lazy(self):
+        values = [
+            math.pi,
+            (3 ** 600, 2 ** 1000 + 1),
+            fractions.Fraction(3 ** 600, 2 ** 1000 + 1),
+        ]
+        for input_value in values:
+            with self.subTest(contfrac_of=input_value):
+                result = contfrac.continued_fraction(input_value,
+                                                     maxlen=10 ** 5)
+                self.assertIsInstance(result, typing.Generator)
+                expected = list(contfrac.continued_fraction(input_value,
+                                                            maxlen=64))
+                self.assertListEqual(expected, list(result)[:64])
+
+    def test_continued_fraction_non_integer_terms(self):
+        test_values = [
+            ([415, 93.0], [4.0, 2.0, 6.0, 7.0]),
+            ((415, 93.0), [4.0, 2.0, 6.0, 7.0]),
+            ([fractions.Fraction(1, 2), fractions.Fraction(1, 3)], [1, 2]),
+            ((fractions.Fraction(1, 2), fractions.Fraction(1, 3)), [1, 2]),
+        ]
+        for input_value, expected_output in test_values:
+            with self.subTest(contfrac_of=input_value):
+                result = list(contfrac.continued_fraction(input_value))
+                self.assertListEqual(expected_output, result)
+                result = [numerator for numerator, _ in
+                          contfrac.convergents(input_value)]
+                self.assertEqual(len(expected_output), len(result))
+
+    def test_continued_fraction_int_subclass(self):
+        for input_value in [True, False]:
+            with self.subTest(contfrac_of=input_value):
+                result = list(contfrac.continued_fraction(input_value))
+                self.assertListEqual([int(input_value)], result)
+                self.assertIs(int, type(result[0]))
 
     def test_continued_fraction_illegal_maxlen(self):
         self.assertRaises(ValueError, contfrac.continued_fraction, 2.2,
@@ -162,26 +327,27 @@ class TestContfracComputation(unittest.TestCase):
         self.assertRaises(TypeError, contfrac.continued_fraction, dict())
 
     def test_continued_fraction_golden_ratio(self):
-        golden_ratio = (1 + math.sqrt(5)) / 2
-        expected = [1] * 40
-        result = list(contfrac.continued_fraction(golden_ratio, maxlen=2))
-        self.assertListEqual(expected[:2], result)
-        result = list(contfrac.continued_fraction(golden_ratio, maxlen=20))
-        self.assertListEqual(expected[:20], result)
-        result = list(contfrac.continued_fraction(golden_ratio, maxlen=31))
-        self.assertListEqual(expected[:31], result)
+        for maxlen in [2, 20, 31]:
+            result = list(contfrac.continued_fraction(GOLDEN_RATIO,
+                                                      maxlen=maxlen))
+            self.assertEqual(list(GOLDEN_RATIO_CONT_FRAC[:maxlen]), result)
 
     def test_rounding_errors(self):
-        golden_ratio = (1 + math.sqrt(5)) / 2
-        as_ratio = golden_ratio.as_integer_ratio()
-        result = list(contfrac.continued_fraction(golden_ratio, maxlen=50))
-        self.assertNotEqual([1] * 50, result)
+        result = list(contfrac.continued_fraction(GOLDEN_RATIO, maxlen=50))
+        self.assertNotEqual(list(GOLDEN_RATIO_CONT_FRAC), result)
         evaluated_value = contfrac.evaluate(result)
-        self.assertEqual(golden_ratio, evaluated_value)
-        result = list(contfrac.continued_fraction(as_ratio, maxlen=50))
-        self.assertNotEqual([1] * 50, result)
+        self.assertEqual(GOLDEN_RATIO, evaluated_value)
+        result = list(contfrac.continued_fraction(GOLDEN_RATIO_AS_RATIO,
+                                                  maxlen=50))
+        self.assertNotEqual(list(GOLDEN_RATIO_CONT_FRAC), result)
         evaluated_value = contfrac.evaluate(result)
-        self.assertEqual(as_ratio, evaluated_value.as_integer_ratio())
+        self.assertEqual(GOLDEN_RATIO_AS_RATIO,
+                         evaluated_value.as_integer_ratio())
+        result = list(contfrac.continued_fraction(GOLDEN_RATIO_AS_RATIO,
+                                                  maxlen=100))
+        evaluated_value = contfrac.evaluate(result, exact=True)
+        self.assertEqual(GOLDEN_RATIO_AS_RATIO,
+                         evaluated_value.as_integer_ratio())
 
 
 class TestConvergents(unittest.TestCase):
@@ -199,6 +365,26 @@ class TestConvergents(unittest.TestCase):
                     (409, 569), (1659, 2308)]
         result = list(contfrac.convergents(x, max_grade=8))
         self.assertListEqual(expected, result)
+        x = fractions.Fraction(415, -93)
+        expected = [(-5, 1), (-4, 1), (-9, 2), (-58, 13), (-415, 93)]
+        result = list(contfrac.convergents(x))
+        self.assertListEqual(expected, result)
+        x = 7
+        expected = [(7, 1)]
+        result = list(contfrac.convergents(x))
+        self.assertListEqual(expected, result)
+
+    def test_convergents_are_lazy(self):
+        num, den = 3 ** 200000, 2 ** 320000 + 1
+        for x in [(num, den), fractions.Fraction(num, den)]:
+            with self.subTest(convergents_of=type(x)):
+                result = contfrac.convergents(x, max_grade=10 ** 6)
+                self.assertIsInstance(result, typing.Generator)
+                self.assertTupleEqual((0, 1), next(result))
+
+    def test_convergents_illegal_max_grade(self):
+        self.assertRaises(ValueError, contfrac.convergents, 2.2, max_grade=-1)
+        list(contfrac.convergents(2.2, max_grade=0))
 
     def test_convergent(self):
         x = 0.84375
@@ -214,6 +400,35 @@ class TestConvergents(unittest.TestCase):
         result = contfrac.convergent(x, 1)
         self.assertTupleEqual(expected, result)
 
+    def test_convergent_repeated_calls(self):
+        x = (415, 93)
+        for grade, expected in enumerate([(4, 1), (9, 2), (58, 13),
+                                          (415, 93)]):
+            self.assertTupleEqual(expected, contfrac.convergent(x, grade))
+            self.assertTupleEqual(expected, contfrac.convergent(x, grade))
+        self.assertTupleEqual((4, 1), contfrac.convergent([415, 93], 0))
+        self.assertIsInstance(contfrac.convergent((415, 93), 0)[0], int)
+        self.assertIsInstance(contfrac.convergent((415.0, 93), 0)[0], float)
+        self.assertRaises(TypeError, contfrac.convergent, 'hello', 1)
+        self.assertRaises(TypeError, contfrac.convergent, dict(), 1)
+
+    def test_convergent_any_grade_order(self):
+        for x in [(415, 93), fractions.Fraction(415, 93), 415 / 93]:
+            with self.subTest(convergent_of=x):
+                self.assertTupleEqual((58, 13), contfrac.convergent(x, 2))
+                self.assertTupleEqual((4, 1), contfrac.convergent(x, 0))
+                self.assertTupleEqual((415, 93), contfrac.convergent(x, 3))
+                self.assertTupleEqual((415, 93), contfrac.convergent(x, 10))
+                self.assertTupleEqual((415, 93), contfrac.convergent(x, 100))
+                self.assertRaises(ValueError, contfrac.convergent, x, -1)
+        x = math.pi
+        expected = list(contfrac.convergents(x, max_grade=100))
+        for grade in [70, 30, 64, 65, 0, 100]:
+            with self.subTest(grade=grade):
+                self.assertTupleEqual(expected[grade],
+                                      contfrac.convergent(x, grade))
+
+
 class TestExampleUsage(unittest.TestCase):
     def test_example_usage_as_in_readme(self):
         import contfrac